@@ -7,93 +7,196 @@ Uses master prompt to generate reports via OpenAI GPT-4.1 nano
 import yaml
 import os
 import argparse
-import requests
+import asyncio
+import aiohttp
+import aiofiles
 import shutil
 from pathlib import Path
 from openai import OpenAI
 from datetime import datetime
 import sys
 import csv
-from io import StringIO
+import functools
 import re
 from bs4 import BeautifulSoup
 
+# Prefer the libyaml-backed C loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# Optional: exact token counts for trimming prompt inputs
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Headers to mimic a real browser, shared by every download
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+# Download retry policy for connection errors and timeouts
+DOWNLOAD_RETRIES = 3
+DOWNLOAD_BACKOFF = 0.3
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# OpenAI client retry policy for rate limits, timeouts and server errors
+OPENAI_MAX_RETRIES = 5
+OPENAI_TIMEOUT = 60.0
+
+# Files written into _INPUT by the download step
+INPUT_FILES = frozenset({
+    'program_sessions.html',
+    'lightning_talks.csv',
+    'attendees.csv',
+    'discussion_notes.txt',
+})
+
+# Local discussion notes file names, in lookup priority order
+NOTES_CANDIDATES = tuple(
+    f"{pattern}{ext}"
+    for ext in ('.txt', '.docx', '.pdf')
+    for pattern in ('discussion_notes', 'notes', 'meeting_notes')
+)
+
+# Error codes the model is instructed to emit on the first line
+ERROR_PREFIX = "ERROR: "
+ERROR_CODES = frozenset({
+    "ERROR: lightning talks URL not accessible",
+    "ERROR: program information not found",
+    "ERROR: notes URL not found",
+    "ERROR: participants URL not found",
+    "ERROR: local files not found",
+    "ERROR: missing input",
+})
+
+# Upper bound on discussion notes sent to the model, and the tokenizer
+# used to count them (GPT-4o / GPT-4.1 family)
+NOTES_MAX_TOKENS = 8000
+NOTES_TOKEN_ENCODING = "o200k_base"
+
+# Lightning talks CSV column holding the requested session
+SESSION_COL = 'Which session is best fit for your proposed lightning talk?  Some sessions have already filled up but please submit and if full you will be put on a standby list.'
+
+# Parsed YAML files keyed by path -> (mtime, size, data)
+_yaml_cache = {}
+
+def _load_yaml_cached(path):
+    """Parse a YAML file, reusing the previous result if the file is unchanged"""
+    st = os.stat(path)
+    key = (st.st_mtime, st.st_size)
+    cached = _yaml_cache.get(path)
+    if cached and cached[:2] == key:
+        return cached[2]
+    
+    with open(path, 'r') as f:
+        data = yaml.load(f, Loader=_SafeLoader)
+    _yaml_cache[path] = (*key, data)
+    return data
+
+def fatal_on_error(msg, missing_file=False):
+    """Decorator: report any exception from the wrapped function and exit
+    
+    With missing_file=True (the config loaders), a FileNotFoundError is
+    reported as "Error: <file> not found" instead of "<msg>: <error>".
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except FileNotFoundError as e:
+                if missing_file:
+                    print(f"❌ Error: {e.filename} not found")
+                else:
+                    print(f"❌ {msg}: {e}")
+                sys.exit(1)
+            except Exception as e:
+                print(f"❌ {msg}: {e}")
+                sys.exit(1)
+        return wrapper
+    return decorator
+
+@fatal_on_error("Error loading secrets", missing_file=True)
 def load_secrets(file_path="secrets.yml"):
     """Load API credentials from secrets.yml"""
-    try:
-        with open(file_path, 'r') as f:
-            secrets = yaml.safe_load(f)
-        return secrets.get('openai_api_key')
-    except FileNotFoundError:
-        print(f"❌ Error: {file_path} not found")
-        sys.exit(1)
-    except Exception as e:
-        print(f"❌ Error loading secrets: {e}")
-        sys.exit(1)
+    secrets = _load_yaml_cached(file_path)
+    return secrets.get('openai_api_key')
 
+@fatal_on_error("Error loading config", missing_file=True)
 def load_config(file_path="config.yml"):
     """Load configuration from config.yml"""
-    try:
-        with open(file_path, 'r') as f:
-            config = yaml.safe_load(f)
-        return config
-    except FileNotFoundError:
-        print(f"❌ Error: {file_path} not found")
-        sys.exit(1)
-    except Exception as e:
-        print(f"❌ Error loading config: {e}")
-        sys.exit(1)
+    return _load_yaml_cached(file_path)
 
 def setup_input_directory():
-    """Clear and recreate _INPUT directory"""
+    """Ensure _INPUT exists and remove stale inputs from a previous run"""
     input_dir = Path("_INPUT")
-    
-    # Remove existing directory if it exists
-    if input_dir.exists():
-        shutil.rmtree(input_dir)
-        print("🧹 Cleared existing _INPUT directory")
-    
-    # Create fresh directory
     input_dir.mkdir(exist_ok=True)
-    print("📁 Created fresh _INPUT directory")
+    
+    # Reuse the directory; only drop the files this run may (re)create so an
+    # optional source that is absent now can't leak in from an earlier run
+    removed = 0
+    for entry in os.scandir(input_dir):
+        if entry.name in INPUT_FILES:
+            os.unlink(entry.path)
+            removed += 1
+    
+    if removed:
+        print("🧹 Cleared existing _INPUT files")
+    print("📁 _INPUT directory ready")
 
-def download_to_input(url, filename):
-    """Download content from URL to _INPUT/filename"""
+async def _fetch(session, url, filename, input_ready):
+    """Download content from URL to _INPUT/filename once input_ready completes"""
     try:
         input_path = Path("_INPUT") / filename
-        
-        # Add headers to mimic a real browser
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
-        
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        # Write content based on file type
-        if filename.endswith('.csv'):
-            with open(input_path, 'w', encoding='utf-8') as f:
-                f.write(response.text)
-        else:
-            with open(input_path, 'w', encoding='utf-8') as f:
-                f.write(response.text)
+        # Write to a temporary name so a failed download never leaves a
+        # truncated file behind under the real name
+        part_path = input_path.with_name(filename + '.part')
+        
+        # Retry connection failures with exponential backoff; HTTP error
+        # statuses are reported straight away
+        for attempt in range(DOWNLOAD_RETRIES + 1):
+            try:
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    # The request is already in flight; only the write has
+                    # to wait for _INPUT to be set up
+                    await input_ready
+                    # Stream the body straight to disk rather than decoding
+                    # the whole response into memory first
+                    try:
+                        async with aiofiles.open(part_path, 'wb') as f:
+                            async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                                await f.write(chunk)
+                    except BaseException:
+                        part_path.unlink(missing_ok=True)
+                        raise
+                os.replace(part_path, input_path)
+                break
+            except aiohttp.ClientResponseError:
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == DOWNLOAD_RETRIES:
+                    raise
+                await asyncio.sleep(DOWNLOAD_BACKOFF * (2 ** attempt))
         
         print(f"✅ Downloaded {filename} from URL")
-        return True
-    except requests.exceptions.RequestException as e:
+        return filename, True
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         print(f"❌ Failed to download {filename}: {e}")
-        return False
+        return filename, False
     except Exception as e:
         print(f"❌ Error saving {filename}: {e}")
-        return False
+        return filename, False
 
 def copy_local_to_input(source_path, filename):
-    """Copy local file to _INPUT directory"""
+    """Link (or copy) local file into _INPUT directory"""
     try:
         source = Path(source_path)
         if not source.exists():
@@ -101,47 +204,52 @@ def copy_local_to_input(source_path, filename):
             return False
         
         dest = Path("_INPUT") / filename
-        shutil.copy2(source, dest)
+        dest.unlink(missing_ok=True)
+        
+        # _INPUT is only ever read, so a hardlink is as good as a copy;
+        # fall back to copying across filesystems or where links aren't supported
+        try:
+            os.link(source, dest)
+        except (OSError, NotImplementedError):
+            shutil.copy2(source, dest)
         print(f"✅ Copied local {filename} to _INPUT")
         return True
     except Exception as e:
         print(f"❌ Error copying {filename}: {e}")
         return False
 
-def download_all_sources(config, args):
-    """Download all configured and provided data sources"""
+async def download_all_sources_async(config, args):
+    """Set up _INPUT and download all configured and provided data sources concurrently"""
     print("\n📥 Downloading data sources...")
     
+    # Prepare _INPUT in a worker thread so the disk work overlaps the downloads
+    input_ready = asyncio.ensure_future(asyncio.to_thread(setup_input_directory))
+    
     success_count = 0
     total_sources = 0
+    downloads = []  # (url, filename) pairs fetched concurrently below
+    copies = []  # (source, filename) pairs copied once _INPUT is ready
     
     # 1. Always download program sessions
     total_sources += 1
-    program_url = config['data_sources']['program_url']
-    if download_to_input(program_url, 'program_sessions.html'):
-        success_count += 1
+    downloads.append((config['data_sources']['program_url'], 'program_sessions.html'))
     
     # 2. Always download lightning talks
     total_sources += 1
-    lightning_url = config['data_sources']['lightning_talks_url']
-    if download_to_input(lightning_url, 'lightning_talks.csv'):
-        success_count += 1
+    downloads.append((config['data_sources']['lightning_talks_url'], 'lightning_talks.csv'))
     
     # 3. Handle participants data
     total_sources += 1
     if args.participants:
         if args.participants.startswith('http'):
             # Download from URL
-            if download_to_input(args.participants, 'attendees.csv'):
-                success_count += 1
+            downloads.append((args.participants, 'attendees.csv'))
         else:
             # Copy from local file
-            if copy_local_to_input(args.participants, 'attendees.csv'):
-                success_count += 1
+            copies.append((args.participants, 'attendees.csv'))
     else:
         # Check for local attendees.csv
-        if copy_local_to_input('attendees.csv', 'attendees.csv'):
-            success_count += 1
+        copies.append(('attendees.csv', 'attendees.csv'))
     
     # 4. Handle discussion notes
     total_sources += 1
@@ -154,80 +262,114 @@ def download_all_sources(config, args):
                 doc_id = notes_url.split('/d/')[1].split('/')[0]
                 notes_url = f"https://docs.google.com/document/d/{doc_id}/export?format=txt"
             
-            if download_to_input(notes_url, 'discussion_notes.txt'):
-                success_count += 1
+            downloads.append((notes_url, 'discussion_notes.txt'))
         else:
             # Copy from local file
-            if copy_local_to_input(args.notes, 'discussion_notes.txt'):
-                success_count += 1
+            copies.append((args.notes, 'discussion_notes.txt'))
     else:
-        # Check for local discussion notes files
+        # Check for local discussion notes files with a single directory
+        # scan instead of probing each candidate name. Names are compared
+        # case-insensitively, as on the default macOS filesystem; an exact
+        # match wins over a case variant
+        local_files = {}
+        for entry in os.scandir("."):
+            if entry.is_file():
+                key = entry.name.casefold()
+                if key not in local_files or entry.name == key:
+                    local_files[key] = entry.name
         found_local_notes = False
-        for ext in ['.txt', '.docx', '.pdf']:
-            for pattern in ['discussion_notes', 'notes', 'meeting_notes']:
-                filename = f"{pattern}{ext}"
-                if copy_local_to_input(filename, 'discussion_notes.txt'):
-                    success_count += 1
-                    found_local_notes = True
-                    break
-            if found_local_notes:
+        for filename in NOTES_CANDIDATES:
+            if filename in local_files:
+                copies.append((local_files[filename], 'discussion_notes.txt'))
+                found_local_notes = True
                 break
         
         if not found_local_notes:
             print("⚠️  No discussion notes found (will proceed without)")
     
+    # Fetch all URLs at once; total time is roughly the slowest single download.
+    # One shared session so same-host requests (e.g. docs.google.com) reuse
+    # pooled keep-alive connections instead of a fresh TCP+TLS handshake each.
+    # Per-connect and per-read limits like requests' timeout=30; no cap on the
+    # whole transfer, which would also count the wait for _INPUT
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=30)
+    connector = aiohttp.TCPConnector(limit=8, limit_per_host=4)
+    async with aiohttp.ClientSession(headers=HEADERS, timeout=timeout, connector=connector) as session:
+        fetches = asyncio.gather(
+            *(_fetch(session, url, filename, input_ready) for url, filename in downloads),
+            return_exceptions=True,
+        )
+        
+        # Local copies run while the downloads are still in flight
+        await input_ready
+        for source, filename in copies:
+            if copy_local_to_input(source, filename):
+                success_count += 1
+        
+        results = await fetches
+    
+    for (url, filename), result in zip(downloads, results):
+        if isinstance(result, BaseException):
+            print(f"❌ Failed to download {filename}: {result}")
+        elif result[1]:
+            success_count += 1
+    
     print(f"\n📊 Downloaded {success_count}/{total_sources} data sources successfully")
     return success_count
 
+@fatal_on_error("Error loading master prompt", missing_file=True)
 def load_master_prompt(file_path="tpc25_master_prompt.yaml"):
     """Load the master prompt from YAML file"""
-    try:
-        with open(file_path, 'r') as f:
-            prompt_data = yaml.safe_load(f)
-        return prompt_data.get('master_prompt')
-    except FileNotFoundError:
-        print(f"❌ Error: {file_path} not found")
-        sys.exit(1)
-    except Exception as e:
-        print(f"❌ Error loading master prompt: {e}")
-        sys.exit(1)
+    prompt_data = _load_yaml_cached(file_path)
+    return prompt_data.get('master_prompt')
+
+@functools.lru_cache(maxsize=1)
+def _load_lightning_by_session(path, mtime_ns, size):
+    """Parse the lightning talks CSV once, grouping talks by session label
+    
+    mtime_ns and size are only part of the cache key, so an edited file is
+    re-read. Values are lists of (row index, talk) in CSV order.
+    """
+    talks_by_session = {}
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        for index, row in enumerate(csv.DictReader(f)):
+            session_label = row.get(SESSION_COL, '')
+            talks_by_session.setdefault(session_label, []).append((index, {
+                'title': row.get('Title of your proposed lightning talk', 'No title'),
+                'author': row.get('Your full name', 'No author'),
+                'institution': row.get('Your institution', 'No institution'),
+                'abstract': row.get('Abstract of your proposed lightning talk (80-100 words)', 'No abstract'),
+                'session_label': session_label
+            }))
+    return talks_by_session
+
+def _lightning_talks_by_session(lightning_file):
+    """Return the cached session -> talks grouping for the current file contents"""
+    st = os.stat(lightning_file)
+    return _load_lightning_by_session(str(lightning_file), st.st_mtime_ns, st.st_size)
 
 def filter_lightning_talks_for_session(breakout_group):
     """Filter lightning talks CSV data for the specific session"""
     input_dir = Path("_INPUT")
     lightning_file = input_dir / "lightning_talks.csv"
     
-    if not lightning_file.exists():
+    if not breakout_group or not lightning_file.exists():
         return None, 0
     
     try:
-        import csv
-        from io import StringIO
+        talks_by_session = _lightning_talks_by_session(lightning_file)
         
-        with open(lightning_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Target-side normalization is constant for the whole pass
+        target, word_pattern, min_shared = _prepare_target(breakout_group)
         
-        # Parse CSV
-        reader = csv.DictReader(StringIO(content))
-        filtered_talks = []
-        
-        for row in reader:
-            session_col = 'Which session is best fit for your proposed lightning talk?  Some sessions have already filled up but please submit and if full you will be put on a standby list.'
-            session_label = row.get(session_col, '')
-            
-            # Check if this talk matches the target session
-            if session_matches(breakout_group, session_label):
-                title = row.get('Title of your proposed lightning talk', 'No title')
-                author = row.get('Your full name', 'No author') 
-                institution = row.get('Your institution', 'No institution')
-                abstract = row.get('Abstract of your proposed lightning talk (80-100 words)', 'No abstract')
-                
-                filtered_talks.append({
-                    'title': title,
-                    'author': author, 
-                    'institution': institution,
-                    'abstract': abstract
-                })
+        # Match each distinct session label once, then restore CSV order
+        matched = [
+            item
+            for session_label, items in talks_by_session.items()
+            if session_matches_fast(target, word_pattern, min_shared, session_label)
+            for item in items
+        ]
+        filtered_talks = [talk for _, talk in sorted(matched, key=lambda item: item[0])]
         
         # Format for the model
         if filtered_talks:
@@ -243,12 +385,28 @@ def filter_lightning_talks_for_session(breakout_group):
         print(f"⚠️  Error filtering lightning talks: {e}")
         return None, 0
 
-def session_matches(target_group, session_label):
-    """Check if session label matches target group using flexible matching"""
-    if not target_group or not session_label:
+def _build_target_matcher(target):
+    """Compile one regex matching any whole word of an uppercased target"""
+    words = set(target.replace(',', '').replace(':', '').split())
+    alternation = '|'.join(re.escape(w) for w in sorted(words))
+    # Whitespace lookarounds mirror str.split() word boundaries
+    pattern = re.compile(r'(?<!\S)(?:' + alternation + r')(?!\S)')
+    return pattern, min(2, len(words))
+
+def _prepare_target(target_group):
+    """Normalize the target group once: uppercased text, word matcher and threshold"""
+    target = target_group.upper().strip()
+    return (target, *_build_target_matcher(target))
+
+# Many talks share the same session label, so each distinct
+# (target, label) pair is only matched once; the target is part of the
+# key, so different groups in one process never collide
+@functools.lru_cache(maxsize=256)
+def session_matches_fast(target, word_pattern, min_shared, session_label):
+    """Match a session label against a target prepared by _prepare_target"""
+    if not session_label:
         return False
     
-    target = target_group.upper().strip()
     session = session_label.upper().strip()
     
     # Exact match
@@ -264,15 +422,21 @@ def session_matches(target_group, session_label):
         return True
     
     # Word-based matching for partial matches
-    target_words = set(target.replace(',', '').replace(':', '').split())
-    session_words = set(session.replace(',', '').replace(':', '').split())
+    session_text = session.replace(',', '').replace(':', '')
     
-    # If most target words appear in session
-    if len(target_words & session_words) >= min(2, len(target_words)):
+    # If most target words appear in session (distinct words only)
+    if len(set(word_pattern.findall(session_text))) >= min_shared:
         return True
     
     return False
 
+def session_matches(target_group, session_label):
+    """Check if session label matches target group using flexible matching"""
+    if not target_group or not session_label:
+        return False
+    
+    return session_matches_fast(*_prepare_target(target_group), session_label)
+
 def create_sample_session_yaml():
     """Create a sample session.yaml file for user to fill out"""
     sample_content = '''# Session Information Configuration
@@ -322,7 +486,7 @@ def load_session_yaml():
         
     try:
         with open(session_file, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_SafeLoader)
         
         session_data = data.get('session', {})
         
@@ -440,26 +604,17 @@ def filter_talks_by_exact_acronym(breakout_group):
         return []
     
     try:
-        with open(lightning_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        reader = csv.DictReader(StringIO(content))
-        filtered_talks = []
-        
-        session_col = 'Which session is best fit for your proposed lightning talk?  Some sessions have already filled up but please submit and if full you will be put on a standby list.'
-        
-        for row in reader:
-            session_label = row.get(session_col, '')
-            
-            # Simple exact acronym match - look for acronym in parentheses
-            if f"({breakout_group})" in session_label or f"({breakout_group.upper()})" in session_label:
-                filtered_talks.append({
-                    'title': row.get('Title of your proposed lightning talk', 'No title'),
-                    'author': row.get('Your full name', 'No author'),
-                    'institution': row.get('Your institution', 'No institution'),
-                    'abstract': row.get('Abstract of your proposed lightning talk (80-100 words)', 'No abstract'),
-                    'session_label': session_label
-                })
+        talks_by_session = _lightning_talks_by_session(lightning_file)
+        
+        # Simple exact acronym match - look for acronym in parentheses
+        matched = [
+            item
+            for session_label, items in talks_by_session.items()
+            if f"({breakout_group})" in session_label or f"({breakout_group.upper()})" in session_label
+            for item in items
+        ]
+        # Copies, so callers can't modify the cached rows
+        filtered_talks = [dict(talk) for _, talk in sorted(matched, key=lambda item: item[0])]
         
         print(f"✅ Found {len(filtered_talks)} lightning talks for {breakout_group}")
         return filtered_talks
@@ -477,20 +632,17 @@ def generate_attendees_appendix():
         return "## Appendix A: Attendees\n\nAttendees list not available.\n\n"
     
     try:
-        with open(attendees_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        reader = csv.DictReader(StringIO(content))
         attendees = []
         
-        for row in reader:
-            first = row.get('First', '').strip()
-            last = row.get('Last', '').strip()
-            org = row.get('Organization', '').strip()
-            
-            if first and last:
-                name = f"{first} {last}"
-                attendees.append({'name': name, 'organization': org})
+        with open(attendees_file, 'r', newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                first = row.get('First', '').strip()
+                last = row.get('Last', '').strip()
+                org = row.get('Organization', '').strip()
+                
+                if first and last:
+                    name = f"{first} {last}"
+                    attendees.append({'name': name, 'organization': org})
         
         if not attendees:
             return "## Appendix A: Attendees\n\nAttendees list not available.\n\n"
@@ -498,16 +650,19 @@ def generate_attendees_appendix():
         # Sort by last name
         attendees.sort(key=lambda x: x['name'].split()[-1] if x['name'] else '')
         
-        appendix = "## Appendix A: Attendees\n\n"
-        appendix += "| Name | Organization |\n"
-        appendix += "|------|--------------|\n"
+        parts = [
+            "## Appendix A: Attendees\n\n",
+            "| Name | Organization |\n",
+            "|------|--------------|\n",
+        ]
         
         for attendee in attendees:
             name = attendee['name'] or 'N/A'
             org = attendee['organization'] or 'N/A'
-            appendix += f"| {name} | {org} |\n"
+            parts.append(f"| {name} | {org} |\n")
         
-        appendix += "\n"
+        parts.append("\n")
+        appendix = ''.join(parts)
         
         print(f"✅ Generated attendees appendix with {len(attendees)} attendees")
         return appendix
@@ -521,41 +676,85 @@ def generate_lightning_talks_appendix(filtered_talks):
     if not filtered_talks:
         return "## Appendix B: Lightning Talks\n\nNo lightning talks found for this session.\n\n"
     
-    appendix = "## Appendix B: Lightning Talks\n\n"
+    parts = ["## Appendix B: Lightning Talks\n\n"]
     
     for i, talk in enumerate(filtered_talks, 1):
-        appendix += f"### {i}. {talk['title']}\n\n"
-        appendix += f"**Author:** {talk['author']}\n\n"
-        appendix += f"**Institution:** {talk['institution']}\n\n"
-        appendix += f"**Abstract:** {talk['abstract']}\n\n"
-        appendix += "---\n\n"
+        parts.append(f"### {i}. {talk['title']}\n\n")
+        parts.append(f"**Author:** {talk['author']}\n\n")
+        parts.append(f"**Institution:** {talk['institution']}\n\n")
+        parts.append(f"**Abstract:** {talk['abstract']}\n\n")
+        parts.append("---\n\n")
     
     print(f"✅ Generated lightning talks appendix with {len(filtered_talks)} talks")
-    return appendix
+    return ''.join(parts)
 
 def generate_report_framework(session_info, filtered_talks):
     """Generate the static parts of the report (title, appendices)"""
     
     # Title section
-    report = f"# {session_info['title']}\n\n"
+    parts = [f"# {session_info['title']}\n\n"]
     
     if session_info.get('leaders'):
-        report += f"**Session Leaders:** {session_info['leaders']}\n\n"
+        parts.append(f"**Session Leaders:** {session_info['leaders']}\n\n")
     
     if session_info.get('description'):
-        report += f"**Description:** {session_info['description']}\n\n"
+        parts.append(f"**Description:** {session_info['description']}\n\n")
     
     # Placeholder for AI-generated content
-    report += "<!-- AI_CONTENT_PLACEHOLDER -->\n\n"
+    parts.append("<!-- AI_CONTENT_PLACEHOLDER -->\n\n")
     
     # Generate appendices
-    attendees_appendix = generate_attendees_appendix()
-    talks_appendix = generate_lightning_talks_appendix(filtered_talks)
+    parts.append(generate_attendees_appendix())
+    parts.append(generate_lightning_talks_appendix(filtered_talks))
     
-    report += attendees_appendix
-    report += talks_appendix
+    return ''.join(parts)
+
+def summarize_attendees_csv(path):
+    """Condense attendees CSV to names grouped under each organization"""
+    # Only First, Last and Organization matter for the report; grouping by
+    # organization avoids repeating the same strings once per attendee
+    by_org = {}
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            first = (row.get('First') or '').strip()
+            last = (row.get('Last') or '').strip()
+            if not (first or last):
+                continue
+            org = (row.get('Organization') or '').strip() or 'N/A'
+            by_org.setdefault(org, []).append(f"{first} {last}".strip())
+    
+    total = sum(len(names) for names in by_org.values())
+    lines = [f"Attendees: {total} people from {len(by_org)} organizations",
+             "Organization (count): names"]
+    for org, names in sorted(by_org.items(), key=lambda item: (-len(item[1]), item[0])):
+        lines.append(f"{org} ({len(names)}): {'; '.join(names)}")
+    return '\n'.join(lines) + '\n'
+
+def truncate_to_tokens(text, max_tokens):
+    """Cut text down to roughly max_tokens model tokens"""
+    tokens = None
+    if tiktoken is not None:
+        try:
+            encoding = tiktoken.get_encoding(NOTES_TOKEN_ENCODING)
+            # Notes are plain text; special-token strings are ordinary text here
+            tokens = encoding.encode(text, disallowed_special=())
+        except Exception as e:
+            # e.g. offline with no cached BPE file; fall back to characters
+            print(f"⚠️  tiktoken unavailable ({e}), estimating tokens from length")
     
-    return report
+    if tokens is not None:
+        if len(tokens) <= max_tokens:
+            return text
+        truncated = encoding.decode(tokens[:max_tokens])
+    else:
+        # Without tiktoken, assume about four characters per token
+        max_chars = max_tokens * 4
+        if len(text) <= max_chars:
+            return text
+        truncated = text[:max_chars]
+    
+    print(f"⚠️  Discussion notes truncated to ~{max_tokens} tokens")
+    return truncated
 
 def read_input_files(breakout_group):
     """Read CSV files and return their content as text"""
@@ -569,97 +768,100 @@ def read_input_files(breakout_group):
         files_content['talk_count'] = talk_count
         print(f"✅ Found {talk_count} lightning talks for session")
     
+    # List _INPUT once rather than stat-ing each expected file
+    try:
+        entries = {e.name: e for e in os.scandir(input_dir)}
+    except FileNotFoundError:
+        entries = {}
+    
     # Read attendees CSV  
-    attendees_file = input_dir / "attendees.csv"
-    if attendees_file.exists():
+    if 'attendees.csv' in entries:
         try:
-            with open(attendees_file, 'r', encoding='utf-8') as f:
-                files_content['attendees'] = f.read()
+            files_content['attendees'] = summarize_attendees_csv(entries['attendees.csv'].path)
         except Exception as e:
             print(f"⚠️  Error reading attendees.csv: {e}")
     
     # Read discussion notes if available
-    notes_file = input_dir / "discussion_notes.txt"
-    if notes_file.exists():
+    if 'discussion_notes.txt' in entries:
         try:
-            with open(notes_file, 'r', encoding='utf-8') as f:
-                files_content['notes'] = f.read()
+            with open(entries['discussion_notes.txt'].path, 'r', encoding='utf-8') as f:
+                files_content['notes'] = truncate_to_tokens(f.read(), NOTES_MAX_TOKENS)
         except Exception as e:
             print(f"⚠️  Error reading discussion_notes.txt: {e}")
     
     return files_content
 
+def make_openai_client(api_key):
+    """Create the OpenAI client; call only once a request is about to be made"""
+    # Construction sets up an HTTP pool and TLS context, so it is deferred
+    # until after all downloads and input validation have succeeded.
+    # Transient API errors are retried with exponential backoff instead of
+    # aborting the run
+    return OpenAI(api_key=api_key, max_retries=OPENAI_MAX_RETRIES, timeout=OPENAI_TIMEOUT)
+
+# Rate limits, timeouts and 5xx responses are retried with backoff by a
+# client from make_openai_client, so anything that reaches the decorator is final
+@fatal_on_error("Error calling OpenAI API")
 def call_openai_api(client, prompt, config):
     """Make API call using configuration settings"""
-    try:
-        model_config = config['model']
-        model_name = model_config['name']
-        
-        print(f"🤖 Calling {model_config['provider']} API with model: {model_name}")
-        print(f"📝 Prompt length: {len(prompt)} characters")
-        
-        response = client.chat.completions.create(
-            model=model_name,
-            messages=[
-                {
-                    "role": "system", 
-                    "content": config['system']['system_message']
-                },
-                {
-                    "role": "user", 
-                    "content": prompt
-                }
-            ],
-            max_tokens=model_config.get('max_tokens', 4000),
-            temperature=model_config.get('temperature', 0.7)
-        )
-        
-        return response.choices[0].message.content
-        
-    except Exception as e:
-        print(f"❌ Error calling OpenAI API: {e}")
-        sys.exit(1)
+    model_config = config['model']
+    model_name = model_config['name']
+    
+    print(f"🤖 Calling {model_config['provider']} API with model: {model_name}")
+    print(f"📝 Prompt length: {len(prompt)} characters")
+    
+    response = client.chat.completions.create(
+        model=model_name,
+        messages=[
+            {
+                "role": "system", 
+                "content": config['system']['system_message']
+            },
+            {
+                "role": "user", 
+                "content": prompt
+            }
+        ],
+        max_tokens=model_config.get('max_tokens', 4000),
+        temperature=model_config.get('temperature', 0.7)
+    )
+    
+    return response.choices[0].message.content
 
 def check_for_errors(content):
     """Check if the response contains error codes and handle them"""
-    lines = content.strip().split('\n')
-    if not lines:
-        return False, None
+    # Only the first non-blank line matters; don't split the whole response
+    first_line = content.lstrip().partition('\n')[0].strip()
     
-    first_line = lines[0].strip()
+    # Every known error code shares the same prefix
+    if not first_line.startswith(ERROR_PREFIX):
+        return False, None
     
-    # Check for known error codes
-    error_codes = [
-        "ERROR: lightning talks URL not accessible",
-        "ERROR: program information not found",
-        "ERROR: notes URL not found",
-        "ERROR: participants URL not found", 
-        "ERROR: local files not found",
-        "ERROR: missing input"
-    ]
+    if first_line in ERROR_CODES:
+        return True, first_line
     
-    for error_code in error_codes:
+    # Error code followed by extra detail on the same line
+    for error_code in ERROR_CODES:
         if error_code in first_line:
             return True, error_code
     
     return False, None
 
+@fatal_on_error("Error saving file")
 def save_output(content, filename="draft_report.txt"):
     """Save the generated content to a file"""
-    try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            # Add header with timestamp
-            f.write(f"# TPC Session Report Draft\n")
-            f.write(f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"# Model: GPT-4.1 nano\n\n")
-            f.write(content)
-        
-        print(f"✅ Report saved to: {filename}")
-        print(f"📄 File size: {len(content)} characters")
-        
-    except Exception as e:
-        print(f"❌ Error saving file: {e}")
-        sys.exit(1)
+    # Add header with timestamp and write everything in a single call
+    header = (
+        "# TPC Session Report Draft\n"
+        f"# Generated: {datetime.now():%Y-%m-%d %H:%M:%S}\n"
+        "# Model: GPT-4.1 nano\n\n"
+    )
+    payload = (header + content).encode('utf-8')
+    with open(filename, 'wb') as f:
+        f.write(payload)
+    
+    print(f"✅ Report saved to: {filename}")
+    print(f"📄 File size: {len(content)} characters")
 
 def parse_arguments():
     """Parse command line arguments"""
@@ -733,12 +935,8 @@ def main():
     
     print("✅ Configuration loaded successfully")
     
-    # Set up OpenAI client
-    client = OpenAI(api_key=api_key)
-    
     # Setup input directory and download all sources
-    setup_input_directory()
-    download_all_sources(config, args)
+    asyncio.run(download_all_sources_async(config, args))
     
     # NEW ARCHITECTURE: Generate report framework using Python
     print("\n📊 Processing data and generating report framework...")